@@ -0,0 +1,60 @@
+"""
+시즌별 KBO 데이터 파일 탐색 및 데이터셋 버전 관리
+
+파일명 규칙: kbo_{pitcher|hitter}_{시즌}_{접미사}.csv
+(예: kbo_pitcher_2025_tabs_final.csv, kbo_hitter_2025_pagination_fix.csv)
+"""
+import os
+import re
+
+SEASON_FILE_PATTERN = r"kbo_{kind}_(\d{{4}})_{suffix}\.csv"
+
+# 페이지에서 사용하는 파일 접미사
+DATA_FILE_SUFFIXES = {"pitcher": "tabs_final", "hitter": "pagination_fix"}
+
+
+def find_season_files(data_dir, kind, suffix):
+    """data_dir에서 시즌별 CSV 파일을 찾아 {시즌: 경로} 형태로 반환 (시즌 오름차순)"""
+    pattern = re.compile(SEASON_FILE_PATTERN.format(kind=kind, suffix=re.escape(suffix)))
+    try:
+        filenames = os.listdir(data_dir)
+    except OSError:
+        return {}
+
+    season_files = {}
+    for filename in filenames:
+        match = pattern.fullmatch(filename)
+        if match:
+            season_files[int(match.group(1))] = os.path.join(data_dir, filename)
+    return dict(sorted(season_files.items()))
+
+
+def data_search_dirs(pages_dir):
+    """데이터 폴더 후보 (순서대로 탐색)"""
+    return [
+        pages_dir,                             # 페이지와 같은 폴더
+        os.path.dirname(pages_dir),            # 상위 폴더
+        os.path.join(pages_dir, "data"),       # 하위 data 폴더 (혹시 있다면)
+        os.getcwd(),                           # 작업 디렉토리 기준
+    ]
+
+
+def find_data_files(kind, pages_dir):
+    """후보 폴더 중 시즌별 파일이 있는 첫 폴더의 {시즌: 경로} - 페이지와 검색이 같은 파일을 쓰도록 공용으로 사용"""
+    for data_dir in data_search_dirs(pages_dir):
+        season_files = find_season_files(data_dir, kind, DATA_FILE_SUFFIXES[kind])
+        if season_files:
+            return season_files
+    return {}
+
+
+def dataset_version(paths):
+    """파일 경로 목록의 (파일명, 수정시각, 크기) 튜플 - 데이터가 갱신되면 값이 바뀌어 캐시가 무효화됨"""
+    version = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            version.append((os.path.basename(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            version.append((os.path.basename(path), None, None))
+    return tuple(version)
@@ -0,0 +1,89 @@
+"""
+리그 대비 지표 및 비교군 통계
+
+1. 리그 대비 "+" 지표 (ERA+, OPS+ ...): 100 = 리그 평균, 높을수록 좋음
+   - 시즌별 리그 평균(출장량 가중)을 groupby 한 번으로 계산
+   - 팀별 파크팩터가 있으면 ERA+ / OPS+에 반영
+2. 비교군 통계: 모든 숫자 스탯의 평균/표준편차와 z-score를 한 번에 계산
+"""
+import numpy as np
+import pandas as pd
+
+# 낮을수록 좋은 스탯이 0일 때(0.00 ERA 등) 지표가 무한대가 되지 않도록 두는 상한
+PLUS_CAP = 999
+
+# 팀명: 홈구장 파크팩터 (1.0 = 중립, 1보다 크면 타자 친화). 값이 없는 팀은 1.0
+PARK_FACTORS = {}
+
+# 지표명: (기준 스탯, 리그 평균 가중치 컬럼, 높을수록 좋은지, 파크팩터 반영 여부)
+PLUS_SPECS = {
+    "pitcher": {
+        "ERA+": ("ERA", "IP_float", False, True),
+        "WHIP+": ("WHIP", "IP_float", False, False),
+        "K/9+": ("K/9", "IP_float", True, False),
+        "BB/9+": ("BB/9", "IP_float", False, False),
+    },
+    "hitter": {
+        "AVG+": ("AVG", "AB", True, False),
+        "ISO+": ("ISOP", "AB", True, False),
+        "GPA+": ("GPA", "PA", True, False),
+    },
+}
+
+
+def league_averages(df, stat_weights, season_col="season"):
+    """시즌별 리그 평균 (출장량 가중) - {스탯: 가중치 컬럼} -> index=시즌, columns=스탯"""
+    seasons = df[season_col]
+    averages = {}
+    for stat, weight_col in stat_weights.items():
+        weight = df[weight_col].astype(float)
+        averages[stat] = (df[stat] * weight).groupby(seasons).sum() / weight.groupby(seasons).sum()
+    return pd.DataFrame(averages)
+
+
+def add_league_index_columns(df, kind, season_col="season", park_factors=None):
+    """
+    리그 대비 "+" 지표 컬럼을 추가한 DataFrame 반환
+    - 가중치 컬럼(IP/PA/AB)이 0인 선수는 NaN (기록 없음)
+    - 낮을수록 좋은 스탯이 0이면 PLUS_CAP
+    """
+    specs = PLUS_SPECS[kind]
+    park_factors = PARK_FACTORS if park_factors is None else park_factors
+
+    stat_weights = {stat: weight_col for stat, weight_col, _, _ in specs.values()}
+    if kind == "hitter":
+        stat_weights.update({"OBP": "PA", "SLG": "AB"})
+    league = league_averages(df, stat_weights, season_col).reindex(df[season_col]).set_index(df.index)
+    park = df["팀명"].map(park_factors).fillna(1.0)
+
+    df = df.copy()
+    # 출장 기록이 없는 행은 NaN으로 가려 0/-100 같은 지표가 나오지 않게 함
+    values = {stat: df[stat].where(df[weight_col] > 0) for stat, weight_col in stat_weights.items()}
+
+    for name, (stat, _, higher_is_better, use_park) in specs.items():
+        if higher_is_better:
+            ratio = values[stat] / league[stat]
+        else:
+            # 0.00 ERA 등은 리그 평균 / 0 = 무한대 -> PLUS_CAP으로 제한
+            with np.errstate(divide="ignore"):
+                ratio = league[stat] / values[stat]
+        if use_park:
+            ratio = ratio * park
+        df[name] = (100 * ratio).clip(upper=PLUS_CAP)
+
+    if kind == "hitter":
+        df["OPS+"] = 100 * (values["OBP"] / league["OBP"] + values["SLG"] / league["SLG"] - 1) / park
+
+    return df
+
+
+def compute_group_stats(ref_df):
+    """
+    비교군의 모든 숫자 스탯에 대해
+    - moments: index=스탯, columns=['mean', 'std', 'count']
+    - z_scores: ref_df와 같은 index, 스탯별 z-score (표준편차 0이면 NaN)
+    """
+    numeric = ref_df.select_dtypes(include="number")
+    moments = numeric.agg(["mean", "std", "count"]).T
+    z_scores = (numeric - moments["mean"]) / moments["std"].replace(0, np.nan)
+    return moments, z_scores
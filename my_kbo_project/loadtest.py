@@ -0,0 +1,538 @@
+"""
+KBO Scouting Report 동시 접속 부하 테스트
+
+실제 `streamlit run main.py` 서버를 띄우고, 한 프로세스 안에서 N개의 웹소켓 클라이언트
+(= 브라우저 탭 N개)를 동시에 붙여 팀 변경 / 선수 변경 / 비교군 전환을 반복합니다.
+
+- 모든 세션이 하나의 서버 프로세스를 공유하므로 스레드 / GIL / st.cache_data /
+  st.cache_resource도 실제 운영과 같이 공유됩니다. -> "서버 1대가 동시 스카우트 몇 명을 감당하는가"
+- CPU / RSS는 서버 프로세스를 /proc에서 주기적으로 샘플링합니다 (Linux 전용, 그 외 OS는 생략).
+- 측정 전 각 페이지를 한 번씩 열어 캐시를 데우고(cold load는 따로 기록), 그 시점의 RSS를
+  기준으로 세션당 메모리 증가량을 계산합니다.
+- 오류가 하나라도 있으면 결과를 저장한 뒤 종료 코드 1로 끝납니다.
+- 클라이언트는 websockets 패키지를 사용합니다 (Streamlit 서버 의존성으로 함께 설치됨).
+
+사용 예:
+    python loadtest.py --sessions 8 --steps 20
+    python loadtest.py --sessions 16 --think-time 2 --compare loadtest_results/<이전 결과>.json
+    python loadtest.py --url http://localhost:8501   # 이미 떠 있는 서버 (자원 측정 생략)
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from datetime import datetime
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BASE_DIR, "loadtest_results")
+ENTRY_SCRIPT = "main.py"
+
+# 페이지별 page_name (브라우저 URL 경로와 같음, main은 빈 문자열)
+PAGES = {
+    "main": "",
+    "pitcher": "Pitcher_Report",
+    "hitter": "Hitter_Report",
+}
+
+# 각 상호작용이 선택될 가중치 (실제 스카우트 사용 패턴 기준: 선수 변경이 가장 잦음)
+INTERACTION_WEIGHTS = {
+    "switch_team": 2,
+    "switch_player": 5,
+    "toggle_compare_group": 1,
+}
+
+# 비교군 라디오는 보직에 따라 옵션이 바뀌어 key 없이 라벨로 찾음
+COMPARE_GROUP_LABEL = "Compare Group:"
+
+PERCENTILES = [50, 90, 95, 99]
+SAMPLE_INTERVAL = 0.2
+
+
+# ---------------------------------------------------------
+# 1. 서버 실행 및 자원 측정 (CPU / RSS)
+# ---------------------------------------------------------
+def find_free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_healthy(url, timeout):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"{url}/_stcore/health", timeout=2) as resp:
+                if resp.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"{timeout:.0f}초 안에 서버가 응답하지 않았습니다: {url}")
+
+
+def start_server(port, log_path, timeout):
+    """streamlit run main.py를 별도 프로세스로 실행하고 health check가 통과할 때까지 대기"""
+    cmd = [
+        sys.executable, "-m", "streamlit", "run", ENTRY_SCRIPT,
+        "--server.headless", "true",
+        "--server.port", str(port),
+        "--server.address", "127.0.0.1",
+        "--server.fileWatcherType", "none",
+        "--browser.gatherUsageStats", "false",
+    ]
+    log = open(log_path, "w", encoding="utf-8")
+    proc = subprocess.Popen(cmd, cwd=BASE_DIR, stdout=log, stderr=subprocess.STDOUT)
+    try:
+        wait_until_healthy(f"http://127.0.0.1:{port}", timeout)
+    except Exception:
+        proc.kill()
+        raise
+    return proc, log
+
+
+class ProcessSampler:
+    """/proc/<pid>에서 CPU 시간과 RSS를 읽음 (Linux 외에는 available = False)"""
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self.available = pid is not None and os.path.exists(f"/proc/{pid}/stat")
+        self.rss_samples = []
+
+    def cpu_seconds(self):
+        with open(f"/proc/{self.pid}/stat") as f:
+            # 2번째 필드(comm)에 공백이 있을 수 있으므로 ')' 뒤부터 분리
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / self.ticks
+
+    def rss_mb(self):
+        with open(f"/proc/{self.pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+        return None
+
+    async def sample_forever(self):
+        while True:
+            self.rss_samples.append(self.rss_mb())
+            await asyncio.sleep(SAMPLE_INTERVAL)
+
+
+# ---------------------------------------------------------
+# 2. 웹소켓 세션 (브라우저 탭 1개)
+# ---------------------------------------------------------
+class ScoutSession:
+    """
+    Streamlit 프론트엔드가 하는 일을 최소한으로 흉내냄
+    - rerun 요청(BackMsg.rerun_script)에 현재 위젯 값을 모두 실어 보냄
+    - 응답(ForwardMsg)에서 위젯 목록 / 예외를 모으고 script_finished까지 대기
+    """
+
+    def __init__(self, ws, page):
+        self.ws = ws
+        self.page = page
+        self.widgets = {}
+        self.values = {}
+
+    async def rerun(self, timeout):
+        """스크립트 한 번 실행. 반환: 오류 메시지 (없으면 None)"""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_name = PAGES[self.page]
+        for widget_id, value in self.values.items():
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            state.string_value = value
+        await self.ws.send(msg.SerializeToString())
+
+        widgets = {}
+        errors = []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            try:
+                data = await asyncio.wait_for(self.ws.recv(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"{timeout:.0f}초 안에 스크립트 실행이 끝나지 않았습니다") from None
+            fwd = ForwardMsg()
+            fwd.ParseFromString(data)
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type in ("selectbox", "radio"):
+                    widgets[getattr(element, element_type).id] = getattr(element, element_type)
+                elif element_type == "exception" and not element.exception.is_warning:
+                    errors.append(f"{element.exception.type}: {element.exception.message}")
+            elif kind == "script_finished":
+                if fwd.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    errors.append("script compile error")
+                # st.rerun / st.switch_page로 다시 실행되는 경우는 다음 script_finished까지 대기
+                if fwd.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    break
+
+        # 브라우저처럼 화면에 남은 위젯의 현재 값을 다음 요청에 그대로 실어 보냄
+        self.widgets = widgets
+        self.values = {wid: self.current_value(wid, w) for wid, w in widgets.items()}
+        self.values = {wid: v for wid, v in self.values.items() if v is not None}
+        return errors[0] if errors else None
+
+    def current_value(self, widget_id, widget):
+        if widget.set_value:
+            return widget.raw_value
+        if self.values.get(widget_id) in widget.options:
+            return self.values[widget_id]
+        if widget.HasField("default") and widget.default < len(widget.options):
+            return widget.options[widget.default]
+        return None
+
+    def find(self, key=None, label=None):
+        for widget_id, widget in self.widgets.items():
+            if (key is not None and widget_id.endswith(f"-{key}")) or (label is not None and widget.label == label):
+                return widget_id, widget
+        raise LookupError(f"위젯을 찾을 수 없습니다: key={key}, label={label}")
+
+    def choose_other(self, widget_id, widget, rng):
+        choices = [opt for opt in widget.options if opt != self.values.get(widget_id)] or list(widget.options)
+        self.values[widget_id] = rng.choice(choices)
+
+
+def switch_team(session, rng):
+    session.choose_other(*session.find(key=f"{session.page}_team"), rng)
+
+
+def switch_player(session, rng):
+    session.choose_other(*session.find(key=f"{session.page}_player"), rng)
+
+
+def toggle_compare_group(session, rng):
+    session.choose_other(*session.find(label=COMPARE_GROUP_LABEL), rng)
+
+
+INTERACTIONS = {
+    "switch_team": switch_team,
+    "switch_player": switch_player,
+    "toggle_compare_group": toggle_compare_group,
+}
+
+
+def build_script(page, steps, rng):
+    # main.py는 위젯이 없으므로 페이지 재실행만 반복
+    if page == "main":
+        return ["rerun"] * steps
+    names = list(INTERACTION_WEIGHTS.keys())
+    weights = list(INTERACTION_WEIGHTS.values())
+    return rng.choices(names, weights=weights, k=steps)
+
+
+async def run_session(ws_url, session_id, page, steps, seed, timeout, think_time, ready, start_event):
+    """
+    하나의 스카우트 세션을 재생
+    반환: 상호작용 기록, 오류 후 건너뛴 단계 수
+    """
+    import websockets
+
+    rng = random.Random(seed + session_id)
+    script = build_script(page, steps, rng)
+    records = []
+
+    async def timed(session, name, action=None):
+        start = time.perf_counter()
+        try:
+            if action is not None:
+                action(session, rng)
+            error = await session.rerun(timeout)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        records.append({
+            "page": page,
+            "session": session_id,
+            "interaction": name,
+            "latency_ms": (time.perf_counter() - start) * 1000,
+            "error": error,
+        })
+        return error is None
+
+    # 오류가 나면 세션 상태를 믿을 수 없으므로 중단하고, 남은 단계는 skipped로 집계
+    skipped = len(script)
+    try:
+        async with websockets.connect(ws_url, subprotocols=["streamlit"], max_size=None,
+                                      open_timeout=timeout) as ws:
+            session = ScoutSession(ws, page)
+            # 모든 세션이 연결된 뒤 동시에 시작
+            ready.set()
+            await start_event.wait()
+            if await timed(session, "initial_load"):
+                for i, name in enumerate(script):
+                    if think_time > 0:
+                        await asyncio.sleep(rng.uniform(0, think_time))
+                    if not await timed(session, name, INTERACTIONS.get(name)):
+                        skipped = len(script) - i - 1
+                        break
+                else:
+                    skipped = 0
+    except Exception as e:
+        records.append({"page": page, "session": session_id, "interaction": "connect",
+                        "latency_ms": 0.0, "error": f"{type(e).__name__}: {e}"})
+    finally:
+        ready.set()
+    return {"records": records, "skipped": skipped}
+
+
+async def warm_up(ws_url, pages, timeout):
+    """각 페이지를 한 번씩 열어 st.cache_data / st.cache_resource를 채움 (cold load 지연시간 기록)"""
+    import websockets
+
+    cold = {}
+    async with websockets.connect(ws_url, subprotocols=["streamlit"], max_size=None,
+                                  open_timeout=timeout) as ws:
+        session = ScoutSession(ws, None)
+        for page in pages:
+            session.page = page
+            session.values = {}
+            start = time.perf_counter()
+            error = await session.rerun(timeout)
+            if error:
+                raise RuntimeError(f"warm-up 실패 ({page}): {error}")
+            cold[page] = round((time.perf_counter() - start) * 1000, 2)
+    return cold
+
+
+async def drive_sessions(ws_url, pages, sessions, steps, seed, timeout, think_time, sampler):
+    jobs = [(page, i) for page in pages for i in range(sessions)]
+    start_event = asyncio.Event()
+    ready = [asyncio.Event() for _ in jobs]
+    tasks = [asyncio.create_task(run_session(ws_url, i, page, steps, seed, timeout, think_time, event, start_event))
+             for (page, i), event in zip(jobs, ready)]
+
+    # 모든 세션의 연결이 열린(또는 실패한) 뒤 동시에 시작 - 연결 실패는 connect 오류로 집계됨
+    await asyncio.gather(*(event.wait() for event in ready))
+    sampling = asyncio.create_task(sampler.sample_forever()) if sampler.available else None
+    cpu_start = sampler.cpu_seconds() if sampler.available else None
+    wall_start = time.perf_counter()
+    start_event.set()
+    results = await asyncio.gather(*tasks)
+    wall = time.perf_counter() - wall_start
+    cpu = sampler.cpu_seconds() - cpu_start if sampler.available else None
+    if sampling is not None:
+        sampling.cancel()
+    return results, wall, cpu
+
+
+# ---------------------------------------------------------
+# 3. 결과 집계 및 저장
+# ---------------------------------------------------------
+def summarize_latencies(records):
+    """상호작용별 지연시간 백분위 (성공 기록 기준) + 오류 수"""
+    groups = {}
+    for r in records:
+        group = groups.setdefault(f"{r['page']}/{r['interaction']}", {"latencies": [], "errors": 0})
+        if r["error"] is None:
+            group["latencies"].append(r["latency_ms"])
+        else:
+            group["errors"] += 1
+
+    summary = {}
+    for key, group in sorted(groups.items()):
+        arr = np.asarray(group["latencies"])
+        if arr.size:
+            stats = {f"p{p}": round(float(np.percentile(arr, p)), 2) for p in PERCENTILES}
+            stats["mean"] = round(float(arr.mean()), 2)
+            stats["max"] = round(float(arr.max()), 2)
+        else:
+            stats = {f"p{p}": None for p in PERCENTILES}
+            stats["mean"] = stats["max"] = None
+        stats["count"] = int(arr.size)
+        stats["errors"] = group["errors"]
+        summary[key] = stats
+    return summary
+
+
+def get_git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_load_test(pages, sessions, steps, seed, timeout, think_time, url=None, warmup=True):
+    proc = log = None
+    if url is None:
+        port = find_free_port()
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        proc, log = start_server(port, os.path.join(RESULTS_DIR, "server.log"), timeout)
+        url = f"http://127.0.0.1:{port}"
+    ws_url = url.replace("http", "ws", 1).rstrip("/") + "/_stcore/stream"
+    # 외부 서버는 PID를 모르므로 자원 측정 생략
+    sampler = ProcessSampler(proc.pid if proc else None)
+
+    try:
+        cold = asyncio.run(warm_up(ws_url, pages, timeout)) if warmup else {}
+        rss_idle = sampler.rss_mb() if sampler.available else None
+        results, wall, cpu = asyncio.run(
+            drive_sessions(ws_url, pages, sessions, steps, seed, timeout, think_time, sampler))
+        rss_end = sampler.rss_mb() if sampler.available else None
+    finally:
+        if proc is not None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+            log.close()
+
+    records = [r for res in results for r in res["records"]]
+    ok = [r for r in records if r["error"] is None]
+    errors = [r for r in records if r["error"] is not None]
+    skipped = sum(res["skipped"] for res in results)
+    total_sessions = len(results)
+
+    server = None
+    if sampler.available:
+        rss_peak = max([s for s in sampler.rss_samples if s is not None] + [rss_end])
+        server = {
+            "cpu_seconds": round(cpu, 3),
+            "cpu_cores_used": round(cpu / wall, 2) if wall > 0 else 0.0,
+            "rss_mb": {
+                "idle": round(rss_idle, 1),
+                "peak": round(rss_peak, 1),
+                "end": round(rss_end, 1),
+                "per_session": round((rss_peak - rss_idle) / total_sessions, 1),
+            },
+        }
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": get_git_commit(),
+        "config": {
+            "pages": pages,
+            "sessions_per_page": sessions,
+            "steps_per_session": steps,
+            "seed": seed,
+            "think_time": think_time,
+            "warmup": warmup,
+            "mode": "single-server-websocket",
+        },
+        "wall_seconds": round(wall, 3),
+        "interactions": len(ok),
+        "errors": len(errors),
+        "skipped": skipped,
+        "throughput_per_sec": round(len(ok) / wall, 2) if wall > 0 else 0.0,
+        "cold_load_ms": cold,
+        "server": server,
+        "latency_ms": summarize_latencies(records),
+        "error_samples": sorted({r["error"] for r in errors})[:10],
+    }
+
+
+def save_result(result, output=None):
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        cfg = result["config"]
+        output = os.path.join(RESULTS_DIR, f"loadtest_{stamp}_s{cfg['sessions_per_page']}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    return output
+
+
+# ---------------------------------------------------------
+# 4. 리포트 출력
+# ---------------------------------------------------------
+def format_ms(value):
+    return f"{value:>10.1f}" if value is not None else f"{'-':>10}"
+
+
+def print_report(result, baseline=None):
+    print(f"\n=== Load Test ({result['timestamp']}, commit {result['git_commit'] or '-'}) ===")
+    cfg = result["config"]
+    print(f"Pages: {', '.join(cfg['pages'])} | Sessions/page: {cfg['sessions_per_page']} | "
+          f"Steps/session: {cfg['steps_per_session']} | Think time: {cfg['think_time']}s | 1 shared server")
+    print(f"Interactions: {result['interactions']} ({result['errors']} errors, {result['skipped']} skipped) "
+          f"in {result['wall_seconds']:.2f}s -> {result['throughput_per_sec']:.2f} req/s")
+    if result["cold_load_ms"]:
+        print("Cold load (warm-up): " + ", ".join(f"{page} {ms:.0f} ms" for page, ms in result["cold_load_ms"].items()))
+
+    server = result["server"]
+    if server:
+        rss = server["rss_mb"]
+        print(f"Server CPU: {server['cpu_seconds']:.2f}s (~{server['cpu_cores_used']:.2f} cores)")
+        print(f"Server RSS: idle {rss['idle']:.1f} MB -> peak {rss['peak']:.1f} MB "
+              f"(~{rss['per_session']:+.1f} MB per session), end {rss['end']:.1f} MB")
+    else:
+        print("Server CPU / RSS: 측정 안 함 (외부 서버 또는 /proc 없음)")
+
+    header = f"\n{'interaction':<34}{'count':>7}{'errors':>8}" + "".join(f"{'p' + str(p):>10}" for p in PERCENTILES)
+    if baseline:
+        header += f"{'Δp95':>10}"
+    print(header)
+    base_latency = baseline["latency_ms"] if baseline else {}
+    for key, stats in result["latency_ms"].items():
+        line = f"{key:<34}{stats['count']:>7}{stats['errors']:>8}"
+        line += "".join(format_ms(stats['p' + str(p)]) for p in PERCENTILES)
+        if baseline:
+            base_p95 = base_latency.get(key, {}).get("p95")
+            if base_p95 and stats["p95"] is not None:
+                line += f"{(stats['p95'] / base_p95 - 1) * 100:>+9.1f}%"
+            else:
+                line += f"{'-':>10}"
+        print(line)
+
+    if baseline:
+        base_server = baseline.get("server") or {}
+        base_rss = base_server.get("rss_mb", {}).get("peak")
+        print(f"\nBaseline: {baseline['timestamp']} (commit {baseline.get('git_commit') or '-'}) "
+              f"{baseline['throughput_per_sec']:.2f} req/s, server RSS peak "
+              f"{f'{base_rss:.1f} MB' if base_rss is not None else '-'}")
+
+    for msg in result["error_samples"]:
+        print(f"[error] {msg}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KBO Scouting Report 동시 세션 부하 테스트")
+    parser.add_argument("--pages", nargs="+", choices=list(PAGES.keys()), default=list(PAGES.keys()),
+                        help="부하를 줄 페이지 (기본: 전체)")
+    parser.add_argument("--sessions", type=int, default=4, help="페이지당 동시 세션 수")
+    parser.add_argument("--steps", type=int, default=10, help="세션당 상호작용 횟수")
+    parser.add_argument("--seed", type=int, default=2025, help="시나리오 재현용 난수 시드")
+    parser.add_argument("--timeout", type=float, default=60, help="한 번의 스크립트 실행 제한 시간(초)")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="상호작용 사이 최대 대기 시간(초, 0~값 사이 무작위). 0이면 쉬지 않고 요청")
+    parser.add_argument("--url", help="이미 실행 중인 서버 주소 (기본: main.py로 서버를 새로 띄움)")
+    parser.add_argument("--no-warmup", action="store_true", help="측정 전 캐시 예열을 하지 않음")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (기본: loadtest_results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    result = run_load_test(args.pages, args.sessions, args.steps, args.seed, args.timeout, args.think_time,
+                           url=args.url, warmup=not args.no_warmup)
+    path = save_result(result, args.output)
+    print_report(result, baseline)
+    print(f"\nSaved: {path}")
+
+    if result["errors"] or result["skipped"]:
+        print(f"\n❌ Load test failed: {result['errors']} errors, {result['skipped']} skipped steps", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,22 @@
 import os
+import sys
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from scipy.spatial import distance
 
+# 공용 모듈은 상위 폴더(my_kbo_project)에 위치
+PAGES_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(PAGES_DIR)
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from kbo_data import dataset_version, find_data_files
+from league_stats import PARK_FACTORS, add_league_index_columns, compute_group_stats
+from player_search import pop_pending_selection, render_player_search
+from projection import project_next_season
+
 # ---------------------------------------------------------
 # 1. 페이지 및 스타일 설정
 # ---------------------------------------------------------
@@ -51,13 +63,18 @@ st.markdown("""
 # ---------------------------------------------------------
 # 2. 데이터 로드 및 전처리
 # ---------------------------------------------------------
-@st.cache_data
-def load_data():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    parent_dir = os.path.dirname(current_dir)
-    csv_path = os.path.join(parent_dir, "kbo_pitcher_2025_tabs_final.csv")
+# 데이터가 갱신될 때마다 version이 바뀌므로 최근 버전만 남기고 이전 캐시는 버림
+@st.cache_data(max_entries=2)
+def load_data(version):
+    # version은 캐시 키 역할 - 파일이 갱신되면 다시 로드
+    season_files = find_data_files("pitcher", PAGES_DIR)
     
-    df = pd.read_csv(csv_path)
+    frames = []
+    for season, csv_path in season_files.items():
+        season_df = pd.read_csv(csv_path)
+        season_df['season'] = season
+        frames.append(season_df)
+    df = pd.concat(frames, ignore_index=True)
     
     def parse_ip(val):
         val = str(val)
@@ -83,9 +100,27 @@ def load_data():
             return 0.0
     df['GO/AO_float'] = df['GO/AO'].apply(parse_go_ao)
     
+    # 리그 대비 지표 (ERA+ 등, 시즌별 리그 평균 기준)
+    df = add_league_index_columns(df, "pitcher")
+    
     return df
 
-df = load_data()
+@st.cache_data(max_entries=2)
+def load_projections(_history, version):
+    # 전체 투수를 한 번에 계산, 데이터셋 버전별로 캐시
+    return project_next_season(_history, "pitcher", key_cols=['선수명', '팀명'])
+
+# 비교군 3개(선발/불펜/전체) x 최근 2개 버전
+@st.cache_data(max_entries=6)
+def load_group_stats(_ref_df, version, group_key):
+    # 비교군별 평균/표준편차/z-score를 한 번에 계산, (데이터셋 버전, 비교군)별로 캐시
+    return compute_group_stats(_ref_df)
+
+data_version = dataset_version(find_data_files("pitcher", PAGES_DIR).values())
+history = load_data(data_version)
+current_season = history['season'].max()
+df = history[history['season'] == current_season]
+projections = load_projections(history, data_version)
 
 # ---------------------------------------------------------
 # 3. 투구 스타일 판정 로직 함수 (업데이트됨)
@@ -166,11 +201,25 @@ def get_player_badge(row):
 # 4. 사이드바 및 선수 선택
 # ---------------------------------------------------------
 st.sidebar.header("🔍 Player Finder")
+render_player_search("pitcher", PAGES_DIR)
+
+# 검색 결과에서 고른 선수를 팀/선수 선택값에 반영 (이번 시즌 기록 기준)
+pending = pop_pending_selection("pitcher")
+if pending is not None:
+    match = df[(df['선수명'] == pending['name']) & (df['팀명'] == pending['team'])]
+    if match.empty:
+        match = df[df['선수명'] == pending['name']]
+    if not match.empty:
+        st.session_state['pitcher_team'] = match.iloc[0]['팀명']
+        st.session_state['pitcher_player'] = match.iloc[0]['선수명']
+    else:
+        st.sidebar.warning(f"{pending['name']} 선수의 {current_season} 시즌 기록이 없습니다.")
+
 team_list = sorted(df['팀명'].unique())
-selected_team = st.sidebar.selectbox("Select Team", team_list)
+selected_team = st.sidebar.selectbox("Select Team", team_list, key='pitcher_team')
 
 player_list = sorted(df[df['팀명'] == selected_team]['선수명'].unique())
-selected_player_name = st.sidebar.selectbox("Select Player", player_list)
+selected_player_name = st.sidebar.selectbox("Select Player", player_list, key='pitcher_player')
 
 # 선택된 선수 데이터 추출
 player_data = df[(df['팀명'] == selected_team) & (df['선수명'] == selected_player_name)].iloc[0]
@@ -197,6 +246,8 @@ else:
 
 st.sidebar.caption(f"Comparing with **{len(ref_df)}** pitchers.")
 
+group_moments, group_z = load_group_stats(ref_df, data_version, compare_group)
+
 # ---------------------------------------------------------
 # 5. 백분위 계산
 # ---------------------------------------------------------
@@ -217,6 +268,21 @@ stats_to_plot = {
     'IP': calculate_percentile(player_data['IP_float'], 'IP_float', False)
 }
 
+# 다음 시즌 예측치 (같은 비교군 기준 백분위)
+proj_season = current_season + 1
+player_proj = projections[(projections['선수명'] == selected_player_name) & (projections['팀명'] == selected_team)]
+proj_data = player_proj.iloc[0] if not player_proj.empty else None
+
+if proj_data is not None:
+    proj_stats_to_plot = {
+        'ERA': calculate_percentile(proj_data['ERA'], 'ERA', True),
+        'WHIP': calculate_percentile(proj_data['WHIP'], 'WHIP', True),
+        'K/9': calculate_percentile(proj_data['K/9'], 'K/9', False),
+        'BB/9': calculate_percentile(proj_data['BB/9'], 'BB/9', True),
+        'OPS': calculate_percentile(proj_data['OPS'], 'OPS', True),
+        'IP': calculate_percentile(proj_data['IP_float'], 'IP_float', False)
+    }
+
 # ---------------------------------------------------------
 # 6. 대시보드 UI
 # ---------------------------------------------------------
@@ -243,7 +309,7 @@ def get_rank_str(value, col, ascending=True):
     return "-"
 
 # (1) KPI Metrics
-kpi1, kpi2, kpi3, kpi4, kpi5 = st.columns(5)
+kpi1, kpi2, kpi3, kpi4, kpi5, kpi6 = st.columns(6)
 
 era_rank_str = get_rank_str(player_data['ERA'], 'ERA', True)
 ops_rank_str = get_rank_str(player_data['OPS'], 'OPS', True)
@@ -255,6 +321,26 @@ kpi2.metric("OPS", f"{player_data['OPS']:.3f}", delta=f"Rank: {ops_rank_str}", d
 kpi3.metric("Record", f"{player_data['W']}W - {player_data['L']}L")
 kpi4.metric("WHIP", f"{player_data['WHIP']:.2f}", delta=f"Rank: {whip_rank_str}", delta_color="off")
 kpi5.metric("Strikeouts", f"{player_data['SO']}", delta=f"Rank: {so_rank_str}", delta_color="off")
+if proj_data is not None:
+    kpi6.metric(f"{proj_season} Proj. ERA", f"{proj_data['ERA']:.2f}",
+                delta=f"{proj_data['ERA'] - player_data['ERA']:+.2f} vs {current_season}", delta_color="inverse",
+                help=f"Marcel 방식 예측 ({proj_data['IP_float']:.0f} IP, {proj_data['SO']:.0f} SO)")
+else:
+    kpi6.metric(f"{proj_season} Proj. ERA", "-")
+
+# (1-2) 리그 대비 지표: 100 = 리그 평균, 높을수록 좋음 / z = 비교군 내 표준점수
+# (기준 스탯, z 부호): 낮을수록 좋은 스탯은 z 부호를 뒤집어 지표와 방향을 맞춤
+plus_stats = {'ERA+': ('ERA', -1), 'WHIP+': ('WHIP', -1), 'K/9+': ('K/9', 1), 'BB/9+': ('BB/9', -1)}
+player_z = group_z.loc[player_data.name] if player_data.name in group_z.index else None
+# 파크팩터 표가 비어 있으면 리그 평균 대비 보정만 된 값임을 안내
+park_note = "" if PARK_FACTORS else " 파크팩터(구장 효과)는 아직 반영되지 않았습니다."
+
+for col, (plus_stat, (base_stat, z_sign)) in zip(st.columns(len(plus_stats)), plus_stats.items()):
+    plus_value = player_data[plus_stat]
+    z_value = player_z[base_stat] * z_sign if player_z is not None else None
+    z_str = f"z {z_value:+.2f} ({base_stat})" if z_value is not None and pd.notna(z_value) else None
+    col.metric(plus_stat, f"{plus_value:.0f}" if pd.notna(plus_value) else "-", delta=z_str, delta_color="off",
+               help=f"리그 평균 {base_stat} 대비 지수 (100 = 평균).{park_note} z는 좋은 쪽이 +가 되도록 부호를 맞춘 비교군 내 표준점수")
 
 st.markdown("---")
 
@@ -271,11 +357,19 @@ with col_left:
     fig_radar = go.Figure()
     fig_radar.add_trace(go.Scatterpolar(
         r=values, theta=categories, fill='toself',
-        name=player_data['선수명'], line_color='#E63946', opacity=0.7
+        name=f"{current_season} {player_data['선수명']}", line_color='#E63946', opacity=0.7
     ))
+    if proj_data is not None:
+        proj_values = list(proj_stats_to_plot.values())
+        proj_values.append(proj_values[0])
+        fig_radar.add_trace(go.Scatterpolar(
+            r=proj_values, theta=categories,
+            name=f"{proj_season} Projection", line=dict(color='#457B9D', dash='dash')
+        ))
     fig_radar.update_layout(
         polar=dict(radialaxis=dict(visible=True, range=[0, 100], ticksuffix="%")),
-        showlegend=False, margin=dict(t=20, b=20)
+        showlegend=proj_data is not None, legend=dict(orientation='h', y=-0.1),
+        margin=dict(t=20, b=20)
     )
     st.plotly_chart(fig_radar, use_container_width=True)
 
@@ -304,7 +398,7 @@ with col_right:
     c3.metric("GO/AO", f"{player_data['GO/AO_float']}", help="1.2 이상이면 땅볼형, 0.8 이하면 뜬공형")
 
     babip = player_data['BABIP']
-    avg_babip = ref_df['BABIP'].mean()
+    avg_babip = group_moments.loc['BABIP', 'mean']
     luck_val = babip - avg_babip
     
     if luck_val < -0.035:
@@ -325,7 +419,7 @@ sim_cols = ['ERA', 'WHIP', 'K/9', 'BB/9', 'GO/AO_float']
 sim_df = ref_df.dropna(subset=sim_cols).copy()
 
 if not sim_df.empty:
-    norm_df = (sim_df[sim_cols] - sim_df[sim_cols].mean()) / sim_df[sim_cols].std()
+    norm_df = group_z.loc[sim_df.index, sim_cols]
     
     if selected_player_name in sim_df['선수명'].values:
         target_idx = sim_df[sim_df['선수명'] == selected_player_name].index[0]
@@ -1,10 +1,22 @@
 import os
+import sys
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from scipy.spatial import distance
 
+# 공용 모듈은 상위 폴더(my_kbo_project)에 위치
+PAGES_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(PAGES_DIR)
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from kbo_data import DATA_FILE_SUFFIXES, dataset_version, find_data_files
+from league_stats import PARK_FACTORS, add_league_index_columns, compute_group_stats
+from player_search import pop_pending_selection, render_player_search
+from projection import project_next_season
+
 # ---------------------------------------------------------
 # 1. 페이지 및 스타일 설정
 # ---------------------------------------------------------
@@ -32,31 +44,19 @@ st.markdown("""
 # ---------------------------------------------------------
 # 2. 데이터 로드 및 전처리 (경로 탐색 강화)
 # ---------------------------------------------------------
-@st.cache_data
-def load_data():
-    csv_filename = "kbo_hitter_2025_pagination_fix.csv"
-    
-    # 1. 현재 파일(2_Hitter_Report.py)의 위치 파악
-    current_file_path = os.path.abspath(__file__)
-    current_dir = os.path.dirname(current_file_path)
-    parent_dir = os.path.dirname(current_dir)
-    
-    # 2. 검색할 경로 후보군 (순서대로 탐색)
-    possible_paths = [
-        os.path.join(current_dir, csv_filename),       # 같은 폴더
-        os.path.join(parent_dir, csv_filename),        # 상위 폴더
-        os.path.join(current_dir, "data", csv_filename), # 하위 data 폴더 (혹시 있다면)
-        csv_filename                                   # 작업 디렉토리 기준
-    ]
+# 데이터가 갱신될 때마다 version이 바뀌므로 최근 버전만 남기고 이전 캐시는 버림
+@st.cache_data(max_entries=2)
+def load_data(version):
+    # version은 캐시 키 역할 - 파일이 갱신되면 다시 로드
+    csv_filename = f"kbo_hitter_<시즌>_{DATA_FILE_SUFFIXES['hitter']}.csv"
+    current_dir = PAGES_DIR
+    parent_dir = PROJECT_DIR
     
-    found_path = None
-    for path in possible_paths:
-        if os.path.exists(path):
-            found_path = path
-            break
+    # 같은 폴더 -> 상위 폴더 -> data 폴더 -> 작업 디렉토리 순으로 탐색 (검색창과 같은 규칙)
+    season_files = find_data_files("hitter", PAGES_DIR)
             
     # 3. 파일을 못 찾았을 때 디버깅 정보 출력 (Streamlit 화면에 보임)
-    if found_path is None:
+    if not season_files:
         st.error(f"❌ 데이터 파일('{csv_filename}')을 찾을 수 없습니다.")
         
         st.warning("아래 내용을 확인해주세요:")
@@ -83,7 +83,12 @@ def load_data():
 
     # 4. 데이터 로드 및 전처리
     try:
-        df = pd.read_csv(found_path)
+        frames = []
+        for season, csv_path in season_files.items():
+            season_df = pd.read_csv(csv_path)
+            season_df['season'] = season
+            frames.append(season_df)
+        df = pd.concat(frames, ignore_index=True)
     except Exception as e:
         st.error(f"파일을 읽는 중 오류가 발생했습니다: {e}")
         return pd.DataFrame()
@@ -99,13 +104,33 @@ def load_data():
     else:
         df['display_name'] = df['선수명']
 
+    # 리그 대비 지표 (OPS+ 등, 시즌별 리그 평균 기준)
+    df = add_league_index_columns(df, "hitter")
+
     return df
 
-df = load_data()
+@st.cache_data(max_entries=2)
+def load_projections(_history, version):
+    # 전체 타자를 한 번에 계산, 데이터셋 버전별로 캐시
+    key_cols = ['ID'] if 'ID' in _history.columns else ['display_name']
+    return project_next_season(_history, "hitter", key_cols=key_cols)
+
+# 비교군 2개(주전/전체) x 최근 2개 버전
+@st.cache_data(max_entries=4)
+def load_group_stats(_ref_df, version, group_key):
+    # 비교군별 평균/표준편차/z-score를 한 번에 계산, (데이터셋 버전, 비교군)별로 캐시
+    return compute_group_stats(_ref_df)
 
-if df.empty:
+data_version = dataset_version(find_data_files("hitter", PAGES_DIR).values())
+history = load_data(data_version)
+
+if history.empty:
     st.stop()
 
+current_season = history['season'].max()
+df = history[history['season'] == current_season]
+projections = load_projections(history, data_version)
+
 # ---------------------------------------------------------
 # 3. 타자 스타일 판정 로직
 # ---------------------------------------------------------
@@ -132,16 +157,30 @@ def determine_hitter_style(row):
 # 4. 사이드바 및 선수 선택
 # ---------------------------------------------------------
 st.sidebar.header("🔍 Player Finder")
+render_player_search("hitter", PAGES_DIR)
+
+# 검색 결과에서 고른 선수를 팀/선수 선택값에 반영 (이번 시즌 기록 기준)
+pending = pop_pending_selection("hitter")
+if pending is not None:
+    if 'ID' in df.columns and pending['player_id'] is not None:
+        match = df[df['ID'] == pending['player_id']]
+    else:
+        match = df[(df['선수명'] == pending['name']) & (df['팀명'] == pending['team'])]
+    if not match.empty:
+        st.session_state['hitter_team'] = match.iloc[0]['팀명']
+        st.session_state['hitter_player'] = match.iloc[0]['display_name']
+    else:
+        st.sidebar.warning(f"{pending['name']} 선수의 {current_season} 시즌 기록이 없습니다.")
 
 # 팀 선택
 team_list = sorted(df['팀명'].unique())
-selected_team = st.sidebar.selectbox("Select Team", team_list)
+selected_team = st.sidebar.selectbox("Select Team", team_list, key='hitter_team')
 
 # 선수 선택 (display_name 사용)
 team_players = df[df['팀명'] == selected_team].sort_values(by='선수명')
 player_list = team_players['display_name'].unique()
 
-selected_player_display = st.sidebar.selectbox("Select Player", player_list)
+selected_player_display = st.sidebar.selectbox("Select Player", player_list, key='hitter_player')
 
 # 선택된 선수 데이터 추출
 player_data = df[df['display_name'] == selected_player_display].iloc[0]
@@ -167,6 +206,8 @@ else:
 
 st.sidebar.caption(f"Comparing with **{len(ref_df)}** hitters.")
 
+group_moments, group_z = load_group_stats(ref_df, data_version, group_option)
+
 # ---------------------------------------------------------
 # 5. 백분위 및 차트
 # ---------------------------------------------------------
@@ -185,6 +226,23 @@ stats_to_plot = {
     'Value (GPA)': calculate_percentile(player_data['GPA'], 'GPA')
 }
 
+# 다음 시즌 예측치 (같은 비교군 기준 백분위)
+proj_season = current_season + 1
+if 'ID' in projections.columns:
+    player_proj = projections[projections['ID'] == player_data['ID']]
+else:
+    player_proj = projections[projections['display_name'] == selected_player_display]
+proj_data = player_proj.iloc[0] if not player_proj.empty else None
+
+if proj_data is not None:
+    proj_stats_to_plot = {
+        'Contact (AVG)': calculate_percentile(proj_data['AVG'], 'AVG'),
+        'Power (ISO)': calculate_percentile(proj_data['ISOP'], 'ISOP'),
+        'Eye (BB/K)': calculate_percentile(proj_data['BB/K'], 'BB/K'),
+        'Clutch (RISP)': calculate_percentile(proj_data['RISP'], 'RISP'),
+        'Value (GPA)': calculate_percentile(proj_data['GPA'], 'GPA')
+    }
+
 # ---------------------------------------------------------
 # 6. 대시보드 UI
 # ---------------------------------------------------------
@@ -200,12 +258,32 @@ def get_rank_str(value, col, ascending=False):
         return f"#{int(p_rank.values[0])}/{len(ref_df)}"
     return "-"
 
-kpi1, kpi2, kpi3, kpi4, kpi5 = st.columns(5)
+kpi1, kpi2, kpi3, kpi4, kpi5, kpi6 = st.columns(6)
 kpi1.metric("AVG", f"{player_data['AVG']:.3f}", f"Rank: {get_rank_str(player_data['AVG'], 'AVG')}", delta_color="off")
 kpi2.metric("HR", f"{int(player_data['HR'])}", f"Rank: {get_rank_str(player_data['HR'], 'HR')}", delta_color="off")
 kpi3.metric("RBI", f"{int(player_data['RBI'])}", f"Rank: {get_rank_str(player_data['RBI'], 'RBI')}", delta_color="off")
 kpi4.metric("OPS", f"{player_data['OPS']:.3f}", f"Rank: {get_rank_str(player_data['OPS'], 'OPS')}", delta_color="off")
 kpi5.metric("GPA", f"{player_data['GPA']:.3f}", f"Rank: {get_rank_str(player_data['GPA'], 'GPA')}", delta_color="off")
+if proj_data is not None:
+    kpi6.metric(f"{proj_season} Proj. OPS", f"{proj_data['OPS']:.3f}",
+                f"{proj_data['OPS'] - player_data['OPS']:+.3f} vs {current_season}",
+                help=f"Marcel 방식 예측 ({proj_data['PA']:.0f} PA, {proj_data['HR']:.0f} HR, {proj_data['RBI']:.0f} RBI)")
+else:
+    kpi6.metric(f"{proj_season} Proj. OPS", "-")
+
+# 리그 대비 지표: 100 = 리그 평균, 높을수록 좋음 / z = 비교군 내 표준점수
+# (기준 스탯, z 부호): 타격 스탯은 모두 높을수록 좋음
+plus_stats = {'OPS+': ('OPS', 1), 'AVG+': ('AVG', 1), 'ISO+': ('ISOP', 1), 'GPA+': ('GPA', 1)}
+player_z = group_z.loc[player_data.name] if player_data.name in group_z.index else None
+# 파크팩터 표가 비어 있으면 리그 평균 대비 보정만 된 값임을 안내
+park_note = "" if PARK_FACTORS else " 파크팩터(구장 효과)는 아직 반영되지 않았습니다."
+
+for col, (plus_stat, (base_stat, z_sign)) in zip(st.columns(len(plus_stats)), plus_stats.items()):
+    plus_value = player_data[plus_stat]
+    z_value = player_z[base_stat] * z_sign if player_z is not None else None
+    z_str = f"z {z_value:+.2f} ({base_stat})" if z_value is not None and pd.notna(z_value) else None
+    col.metric(plus_stat, f"{plus_value:.0f}" if pd.notna(plus_value) else "-", delta=z_str, delta_color="off",
+               help=f"리그 평균 {base_stat} 대비 지수 (100 = 평균).{park_note} z는 좋은 쪽이 +가 되도록 부호를 맞춘 비교군 내 표준점수")
 
 st.markdown("---")
 
@@ -221,11 +299,19 @@ with col_left:
     fig_radar = go.Figure()
     fig_radar.add_trace(go.Scatterpolar(
         r=values, theta=categories, fill='toself',
-        name=selected_player_real_name, line_color='#29B5E8', opacity=0.7
+        name=f"{current_season} {selected_player_real_name}", line_color='#29B5E8', opacity=0.7
     ))
+    if proj_data is not None:
+        proj_values = list(proj_stats_to_plot.values())
+        proj_values.append(proj_values[0])
+        fig_radar.add_trace(go.Scatterpolar(
+            r=proj_values, theta=categories,
+            name=f"{proj_season} Projection", line=dict(color='#F4A261', dash='dash')
+        ))
     fig_radar.update_layout(
         polar=dict(radialaxis=dict(visible=True, range=[0, 100], ticksuffix="%")),
-        showlegend=False, margin=dict(t=20, b=20)
+        showlegend=proj_data is not None, legend=dict(orientation='h', y=-0.1),
+        margin=dict(t=20, b=20)
     )
     st.plotly_chart(fig_radar, use_container_width=True)
 
@@ -274,7 +360,7 @@ sim_cols = ['AVG', 'HR', 'OPS', 'BB/K', 'ISOP']
 sim_df = ref_df.dropna(subset=sim_cols).copy()
 
 if not sim_df.empty and len(sim_df) > 1:
-    norm_df = (sim_df[sim_cols] - sim_df[sim_cols].mean()) / sim_df[sim_cols].std()
+    norm_df = group_z.loc[sim_df.index, sim_cols]
     
     # 내 벡터 찾기
     if selected_player_display in sim_df['display_name'].values:
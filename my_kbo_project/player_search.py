@@ -0,0 +1,304 @@
+"""
+투수/타자 통합 선수 검색
+
+선수명을 여러 형태의 검색 키로 바꿔 미리 색인해 두고, 입력할 때마다 색인만 조회합니다.
+- 한글 이름 / 자모 분해 (입력 중인 글자도 매칭: '김주' -> 김준태)
+- 초성 ('ㄱㅈㅌ' -> 김준태)
+- 로마자 표기 ('kim', 'juntae', 'garabito')
+- 선수 ID
+
+색인 구조:
+- 필드별로 정렬된 고유 키 목록 -> 접두어 검색은 bisect 한 번
+- 필드별 bigram -> 키 집합 -> 부분 문자열 / 오타 허용 검색
+"""
+import bisect
+import heapq
+from collections import defaultdict
+
+import pandas as pd
+import streamlit as st
+
+from kbo_data import DATA_FILE_SUFFIXES, dataset_version, find_data_files
+
+# st.switch_page 경로는 main.py 기준
+PAGE_FILES = {
+    "pitcher": "pages/1_Pitcher_Report.py",
+    "hitter": "pages/2_Hitter_Report.py",
+}
+KIND_LABELS = {"pitcher": "Pitcher", "hitter": "Hitter"}
+
+# ---------------------------------------------------------
+# 1. 한글 분해 / 로마자 표기
+# ---------------------------------------------------------
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+            "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+# 국어의 로마자 표기법 (음운 변화는 반영하지 않음)
+ROMAN_CHO = ["g", "kk", "n", "d", "tt", "r", "m", "b", "pp", "s", "ss", "", "j", "jj", "ch", "k", "t", "p", "h"]
+ROMAN_JUNG = ["a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o", "wa", "wae", "oe", "yo", "u", "wo", "we",
+              "wi", "yu", "eu", "ui", "i"]
+ROMAN_JONG = ["", "k", "k", "k", "n", "n", "n", "t", "l", "k", "m", "l", "l", "l", "p", "l", "m", "p", "p",
+              "t", "t", "ng", "t", "t", "k", "t", "p", "t"]
+
+# 관용적으로 쓰는 성씨 표기 (Kim, Lee, Park ...)
+SURNAME_ROMAN = {
+    "김": "kim", "이": "lee", "박": "park", "최": "choi", "정": "jung", "강": "kang", "조": "cho",
+    "윤": "yoon", "장": "jang", "임": "lim", "한": "han", "오": "oh", "서": "seo", "신": "shin",
+    "권": "kwon", "황": "hwang", "안": "ahn", "송": "song", "류": "ryu", "유": "yoo", "홍": "hong",
+    "전": "jeon", "고": "ko", "문": "moon", "양": "yang", "손": "son", "배": "bae", "노": "noh",
+    "하": "ha", "곽": "kwak", "구": "koo", "우": "woo", "민": "min", "심": "shim", "변": "byun",
+}
+
+
+def is_hangul_syllable(ch):
+    return HANGUL_BASE <= ord(ch) <= HANGUL_LAST
+
+
+def split_syllable(ch):
+    code = ord(ch) - HANGUL_BASE
+    return code // 588, (code % 588) // 28, code % 28
+
+
+def to_chosung(text):
+    return "".join(CHOSUNG[split_syllable(ch)[0]] if is_hangul_syllable(ch) else ch for ch in text)
+
+
+def to_jamo(text):
+    result = []
+    for ch in text:
+        if is_hangul_syllable(ch):
+            cho, jung, jong = split_syllable(ch)
+            result.append(CHOSUNG[cho] + JUNGSUNG[jung] + JONGSUNG[jong])
+        else:
+            result.append(ch)
+    return "".join(result)
+
+
+def romanize(text):
+    result = []
+    for ch in text:
+        if is_hangul_syllable(ch):
+            cho, jung, jong = split_syllable(ch)
+            result.append(ROMAN_CHO[cho] + ROMAN_JUNG[jung] + ROMAN_JONG[jong])
+        elif ch.isalnum():
+            result.append(ch.lower())
+    return "".join(result)
+
+
+def roman_keys(name):
+    """표준 표기와 관용 성씨 표기 두 가지 로마자 키"""
+    keys = {romanize(name)}
+    if name and name[0] in SURNAME_ROMAN:
+        keys.add(SURNAME_ROMAN[name[0]] + romanize(name[1:]))
+    return keys
+
+
+def bigrams(text):
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def query_fields(query):
+    """검색어의 문자 종류에 따라 조회할 (필드, 정규화된 검색어) 목록"""
+    query = "".join(query.split())
+    if not query:
+        return []
+    if all(ch in CHOSUNG for ch in query):
+        return [("chosung", query), ("jamo", query)]
+    if any(is_hangul_syllable(ch) or ch in CHOSUNG or ch in JUNGSUNG for ch in query):
+        return [("jamo", to_jamo(query))]
+    fields = [("roman", romanize(query))]
+    if query.isdigit():
+        fields.append(("id", query))
+    # 기호만 입력한 경우 등 정규화 후 빈 검색어는 모든 키와 접두어 매칭되므로 제외
+    return [(field, normalized) for field, normalized in fields if normalized]
+
+
+# ---------------------------------------------------------
+# 2. 검색 색인
+# ---------------------------------------------------------
+# 매칭 종류별 점수 (같은 점수면 최근 시즌, 출장 경기 수 순)
+EXACT, PREFIX, SUBSTRING = 3.0, 2.0, 1.0
+FUZZY_THRESHOLD = 0.5
+# ID는 숫자 bigram이 겹쳐도 관계없는 선수이므로 오타 허용 검색에서 제외
+NO_FUZZY_FIELDS = {"id"}
+
+
+class PlayerSearchIndex:
+    """선수-시즌 목록에 대한 접두어 / bigram 색인"""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self._sorted_keys = {}
+        self._key_entries = {}
+        self._bigrams = {}
+        self._bigram_counts = {}
+
+        # 점수가 같을 때의 순위를 미리 계산 (최근 시즌 -> 출장 경기 수 -> 이름)
+        order = sorted(range(len(entries)),
+                       key=lambda i: (-entries[i]["season"], -entries[i]["games"], entries[i]["name"]))
+        self._tiebreak = [0] * len(entries)
+        for rank, i in enumerate(order):
+            self._tiebreak[i] = rank
+
+        key_entries = defaultdict(lambda: defaultdict(list))
+        for i, entry in enumerate(entries):
+            for field, key in self._entry_keys(entry):
+                if key:
+                    key_entries[field][key].append(i)
+
+        for field, mapping in key_entries.items():
+            self._key_entries[field] = dict(mapping)
+            self._sorted_keys[field] = sorted(mapping)
+            grams = defaultdict(set)
+            for key in mapping:
+                for gram in bigrams(key):
+                    grams[gram].add(key)
+            self._bigrams[field] = dict(grams)
+            self._bigram_counts[field] = {key: len(bigrams(key)) for key in mapping}
+
+    @staticmethod
+    def _entry_keys(entry):
+        name = entry["name"]
+        yield "jamo", to_jamo(name)
+        yield "chosung", to_chosung(name)
+        for key in roman_keys(name):
+            yield "roman", key
+        if entry["player_id"] is not None:
+            yield "id", str(entry["player_id"])
+
+    def _match_keys(self, field, query, fuzzy):
+        """{키: 점수}: 접두어 -> 부분 문자열 (-> fuzzy면 오타 허용) 순으로 조회"""
+        keys = self._sorted_keys.get(field, [])
+        grams = self._bigrams.get(field, {})
+        scores = {}
+
+        start = bisect.bisect_left(keys, query)
+        end = bisect.bisect_left(keys, query + "\uffff")
+        for key in keys[start:end]:
+            scores[key] = EXACT if key == query else PREFIX
+
+        query_grams = bigrams(query)
+        if not query_grams:
+            return scores
+
+        # 모든 bigram을 포함하는 키만 후보 -> 실제 부분 문자열인지 확인
+        candidate_sets = sorted((grams.get(g, set()) for g in query_grams), key=len)
+        for key in set.intersection(*candidate_sets) - scores.keys():
+            if query in key:
+                scores[key] = SUBSTRING
+
+        if not fuzzy or field in NO_FUZZY_FIELDS:
+            return scores
+
+        # 오타 허용: bigram 유사도(Dice)가 기준 이상인 키
+        counts = self._bigram_counts[field]
+        overlap = defaultdict(int)
+        for gram in query_grams:
+            for key in grams.get(gram, ()):
+                overlap[key] += 1
+        for key, common in overlap.items():
+            if key in scores:
+                continue
+            dice = 2 * common / (len(query_grams) + counts[key])
+            if dice >= FUZZY_THRESHOLD:
+                scores[key] = dice
+        return scores
+
+    def _collect(self, fields, fuzzy):
+        best = {}
+        for field, normalized in fields:
+            for key, score in self._match_keys(field, normalized, fuzzy).items():
+                for i in self._key_entries[field][key]:
+                    if score > best.get(i, 0):
+                        best[i] = score
+        return best
+
+    def search(self, query, limit=10):
+        fields = query_fields(query)
+        best = self._collect(fields, fuzzy=False)
+        # 정확/접두어/부분 일치가 부족할 때만 오타 허용 검색
+        if len(best) < limit:
+            best = self._collect(fields, fuzzy=True)
+
+        top = heapq.nsmallest(limit, best.items(), key=lambda item: (-item[1], self._tiebreak[item[0]]))
+        return [self.entries[i] for i, _ in top]
+
+
+# ---------------------------------------------------------
+# 3. 데이터 로드 및 Streamlit 위젯
+# ---------------------------------------------------------
+def search_data_files(pages_dir):
+    """{종류: {시즌: 경로}} - 각 페이지와 같은 규칙(find_data_files)으로 파일을 찾음"""
+    return {kind: find_data_files(kind, pages_dir) for kind in DATA_FILE_SUFFIXES}
+
+
+def load_search_entries(data_files):
+    """전체 시즌의 투수/타자 CSV에서 검색에 필요한 컬럼만 읽어 선수-시즌 목록 생성"""
+    entries = []
+    for kind, season_files in data_files.items():
+        for season, csv_path in season_files.items():
+            df = pd.read_csv(csv_path, usecols=lambda c: c in ("ID", "선수명", "팀명", "G"))
+            ids = df["ID"] if "ID" in df.columns else [None] * len(df)
+            for name, team, games, player_id in zip(df["선수명"], df["팀명"], df["G"], ids):
+                entries.append({
+                    "kind": kind,
+                    "name": name,
+                    "team": team,
+                    "season": season,
+                    "games": int(games),
+                    "player_id": None if player_id is None else int(player_id),
+                })
+    return entries
+
+
+# 데이터가 갱신되면 새 버전의 색인만 남기고 이전 색인은 버림
+@st.cache_resource(max_entries=1)
+def get_search_index(data_files, version):
+    # version은 캐시 키 역할 - 파일이 갱신되면 색인을 다시 생성
+    return PlayerSearchIndex(load_search_entries(data_files))
+
+
+def entry_label(entry):
+    label = f"{entry['name']} ({entry['team']}) · {KIND_LABELS[entry['kind']]} {entry['season']}"
+    if entry["player_id"] is not None:
+        label += f" · #{entry['player_id']}"
+    return label
+
+
+def pop_pending_selection(kind):
+    """검색 결과에서 고른 선수 (현재 페이지 종류와 같을 때만 꺼내옴)"""
+    pending = st.session_state.get("search_selection")
+    if pending is not None and pending["kind"] == kind:
+        return st.session_state.pop("search_selection")
+    return None
+
+
+def render_player_search(kind, pages_dir, limit=8):
+    """사이드바 검색창 - 결과를 누르면 해당 선수 페이지로 이동"""
+    data_files = search_data_files(pages_dir)
+    paths = [path for season_files in data_files.values() for path in season_files.values()]
+    index = get_search_index(data_files, dataset_version(paths))
+    query = st.sidebar.text_input(
+        "Search Player", placeholder="이름 / 초성(ㄱㅈㅌ) / 영문 / ID",
+        help="투수와 타자 전체에서 검색합니다."
+    )
+    if not query:
+        return
+
+    matches = index.search(query, limit=limit)
+    if not matches:
+        st.sidebar.caption("검색 결과가 없습니다.")
+        return
+
+    for i, entry in enumerate(matches):
+        if st.sidebar.button(entry_label(entry), key=f"search_result_{i}", use_container_width=True):
+            st.session_state["search_selection"] = entry
+            if entry["kind"] == kind:
+                st.rerun()
+            else:
+                st.switch_page(PAGE_FILES[entry["kind"]])
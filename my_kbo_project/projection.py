@@ -0,0 +1,144 @@
+"""
+다음 시즌 성적 예측 (Marcel 방식)
+
+1. 최근 시즌일수록 큰 가중치를 주어 과거 성적을 가중 평균
+2. 리그 평균 성적을 일정량(regression) 섞어 평균으로 회귀
+3. 나이 컬럼이 있으면 나이에 따른 성장/노화 보정
+
+선수별 반복 없이 전체 데이터에 대해 groupby 한 번으로 계산합니다.
+"""
+import numpy as np
+import pandas as pd
+
+AGE_COLUMN = "나이"
+PEAK_AGE = 29
+
+# weights: 가장 최근 시즌부터 과거 순서의 가중치 (최근 시즌 = 1)
+# regression: 섞어줄 리그 평균의 양 (volume 단위, Marcel의 1200 PA / 134 IP를 최근 시즌 가중치 기준으로 환산)
+# base_volume: 다음 시즌 출장량 = 0.5 * 작년 + 0.1 * 재작년 + base_volume
+# rates: 예측할 비율 스탯과 방향 (True = 높을수록 좋음)
+PROJECTION_SPECS = {
+    "pitcher": {
+        "volume": "IP_float",
+        "weights": (1.0, 2 / 3, 1 / 3),
+        "regression": 134 / 3,
+        "base_volume": 25,
+        "starter_base_volume": 60,
+        "rates": {
+            "ERA": False,
+            "WHIP": False,
+            "K/9": True,
+            "BB/9": False,
+            "OPS": False,
+            "BABIP": False,
+        },
+    },
+    "hitter": {
+        "volume": "PA",
+        "weights": (1.0, 0.8, 0.6),
+        "regression": 1200 / 5,
+        "base_volume": 200,
+        "rates": {
+            "AVG": True,
+            "OBP": True,
+            "SLG": True,
+            "ISOP": True,
+            "GPA": True,
+            "RISP": True,
+            "BB_rate": True,
+            "SO_rate": False,
+            "HR_rate": True,
+            "RBI_rate": True,
+        },
+    },
+}
+
+# 카운팅 스탯을 출장량 대비 비율로 바꿔 예측한 뒤 예측 출장량을 곱해 되돌림
+HITTER_COUNT_RATES = {"BB_rate": "BB", "SO_rate": "SO", "HR_rate": "HR", "RBI_rate": "RBI"}
+
+
+def age_factor(age):
+    """Marcel 나이 보정: 29세 이전은 해마다 +0.6%, 이후는 -0.3%"""
+    age = np.asarray(age, dtype=float)
+    factor = np.where(age > PEAK_AGE, 1 + (age - PEAK_AGE) * -0.003, 1 + (PEAK_AGE - age) * 0.006)
+    return np.where(np.isnan(age), 1.0, factor)
+
+
+def project_next_season(history, kind, key_cols, season_col="season"):
+    """
+    history: 여러 시즌이 합쳐진 DataFrame (season_col 컬럼 필요)
+    kind: 'pitcher' 또는 'hitter'
+    key_cols: 시즌 간 같은 선수를 묶는 컬럼 (예: ['ID'], ['선수명', '팀명'])
+
+    반환: key_cols별 한 행, 예측 스탯 컬럼 + 'proj_volume' + season_col(예측 시즌)
+    """
+    spec = PROJECTION_SPECS[kind]
+    volume_col = spec["volume"]
+    weights = np.asarray(spec["weights"])
+    regression = spec["regression"]
+
+    data = history[history[volume_col] > 0].copy()
+    if data.empty:
+        return pd.DataFrame(columns=key_cols + list(spec["rates"]) + ["proj_volume", season_col])
+
+    latest_season = data[season_col].max()
+    seasons_back = (latest_season - data[season_col]).to_numpy()
+    data = data[seasons_back < len(weights)]
+    seasons_back = seasons_back[seasons_back < len(weights)]
+
+    if kind == "hitter":
+        for rate_col, count_col in HITTER_COUNT_RATES.items():
+            data[rate_col] = data[count_col] / data[volume_col]
+
+    rate_cols = list(spec["rates"])
+    volume = data[volume_col].to_numpy(dtype=float)
+    rates = data[rate_cols].apply(pd.to_numeric, errors="coerce").fillna(0.0)
+    weighted_volume = weights[seasons_back] * volume
+
+    # 시즌별 리그 평균 (출장량 가중) -> 각 선수-시즌 행에 붙임
+    seasons = data[season_col]
+    league = (rates.mul(volume, axis=0).groupby(seasons).sum()
+              .div(pd.Series(volume, index=data.index).groupby(seasons).sum(), axis=0))
+    league_rows = league.loc[seasons].to_numpy()
+
+    keys = [data[c] for c in key_cols]
+    wv_sum = pd.Series(weighted_volume, index=data.index).groupby(keys).sum()
+    player_sum = rates.mul(weighted_volume, axis=0).groupby(keys).sum()
+    league_sum = pd.DataFrame(league_rows * weighted_volume[:, None], index=data.index,
+                              columns=rate_cols).groupby(keys).sum()
+
+    # 선수가 뛴 시즌 구성에 맞춘 리그 평균에 regression만큼 회귀
+    player_league = league_sum.div(wv_sum, axis=0)
+    proj = (player_sum + player_league.mul(regression, axis=0)).div(wv_sum + regression, axis=0)
+
+    def volume_of(back):
+        mask = seasons_back == back
+        return (pd.Series(volume[mask], index=data.index[mask])
+                .groupby([k[mask] for k in keys]).sum()
+                .reindex(proj.index, fill_value=0.0))
+
+    latest = data[seasons_back == 0].drop_duplicates(subset=key_cols).set_index(key_cols)
+    base_volume = pd.Series(float(spec["base_volume"]), index=proj.index)
+    if "starter_base_volume" in spec:
+        is_starter = (latest["GS"] > latest["G"] / 2).reindex(proj.index, fill_value=False)
+        base_volume[is_starter.to_numpy()] = spec["starter_base_volume"]
+    proj_volume = 0.5 * volume_of(0) + 0.1 * volume_of(1) + base_volume
+
+    if AGE_COLUMN in latest.columns:
+        factor = age_factor(latest[AGE_COLUMN].reindex(proj.index) + 1)
+        for col, higher_is_better in spec["rates"].items():
+            proj[col] = proj[col] * factor if higher_is_better else proj[col] / factor
+
+    if kind == "pitcher":
+        proj["IP_float"] = proj_volume
+        proj["SO"] = proj["K/9"] * proj_volume / 9
+    else:
+        proj["PA"] = proj_volume
+        proj["OPS"] = proj["OBP"] + proj["SLG"]
+        proj["BB/K"] = proj["BB_rate"] / proj["SO_rate"].replace(0, np.nan)
+        proj["HR"] = proj["HR_rate"] * proj_volume
+        proj["RBI"] = proj["RBI_rate"] * proj_volume
+
+    proj["proj_volume"] = proj_volume
+    proj[season_col] = latest_season + 1
+    return proj.reset_index()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# 공용 모듈은 상위 폴더(my_kbo_project)에 위치 - 페이지와 같은 방식으로 경로 추가
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
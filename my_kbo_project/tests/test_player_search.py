@@ -0,0 +1,137 @@
+import time
+
+import pytest
+
+from player_search import (
+    PlayerSearchIndex,
+    query_fields,
+    roman_keys,
+    romanize,
+    to_chosung,
+    to_jamo,
+)
+
+
+def make_entry(name, season=2025, games=10, player_id=None, kind="pitcher", team="KT"):
+    return {"kind": kind, "name": name, "team": team, "season": season, "games": games, "player_id": player_id}
+
+
+@pytest.fixture
+def index():
+    return PlayerSearchIndex([
+        make_entry("김준태", games=30, player_id=62558),
+        make_entry("김주원", games=120, player_id=68912, kind="hitter"),
+        make_entry("가라비토", games=15, player_id=55640),
+        make_entry("김준태", season=2024, games=40, player_id=62558),
+        make_entry("이정후", games=140, player_id=66206, kind="hitter"),
+    ])
+
+
+# ---------------------------------------------------------
+# 1. 한글 분해 / 로마자 표기
+# ---------------------------------------------------------
+def test_to_jamo_decomposes_syllables():
+    assert to_jamo("김준태") == "ㄱㅣㅁㅈㅜㄴㅌㅐ"
+    # 한글이 아닌 문자는 그대로
+    assert to_jamo("A김") == "Aㄱㅣㅁ"
+
+
+def test_to_chosung():
+    assert to_chosung("김준태") == "ㄱㅈㅌ"
+
+
+def test_romanize_and_surname_spelling():
+    assert romanize("가라비토") == "garabito"
+    assert romanize("김준태") == "gimjuntae"
+    assert roman_keys("김준태") == {"gimjuntae", "kimjuntae"}
+    assert roman_keys("가라비토") == {"garabito"}
+
+
+# ---------------------------------------------------------
+# 2. 검색어 종류별 조회 필드
+# ---------------------------------------------------------
+def test_query_fields_routing():
+    assert query_fields("ㄱㅈㅌ") == [("chosung", "ㄱㅈㅌ"), ("jamo", "ㄱㅈㅌ")]
+    assert query_fields("김주") == [("jamo", "ㄱㅣㅁㅈㅜ")]
+    assert query_fields("Kim Jun") == [("roman", "kimjun")]
+    assert query_fields("62558") == [("roman", "62558"), ("id", "62558")]
+
+
+@pytest.mark.parametrize("query", ["", "   ", "-", ".#"])
+def test_query_fields_drops_empty_queries(query):
+    assert query_fields(query) == []
+
+
+# ---------------------------------------------------------
+# 3. 검색 / 순위
+# ---------------------------------------------------------
+def names(results):
+    return [(entry["name"], entry["season"]) for entry in results]
+
+
+def test_search_chosung(index):
+    # 결과가 limit보다 적으면 오타 허용 결과가 뒤에 붙으므로 앞부분만 확인
+    assert names(index.search("ㄱㅈㅌ"))[:2] == [("김준태", 2025), ("김준태", 2024)]
+
+
+def test_search_partial_syllable_matches_prefix(index):
+    # 입력 중인 '김주'는 김준태(ㄱㅣㅁㅈㅜㄴ...)와 김주원 모두 접두어 매칭
+    result = names(index.search("김주"))
+    assert set(result[:3]) == {("김준태", 2025), ("김준태", 2024), ("김주원", 2025)}
+
+
+def test_search_romanized(index):
+    assert names(index.search("garabito")) == [("가라비토", 2025)]
+    assert names(index.search("kimjuntae"))[0] == ("김준태", 2025)
+
+
+def test_search_id_skips_fuzzy(index):
+    assert names(index.search("62558")) == [("김준태", 2025), ("김준태", 2024)]
+    # 숫자 bigram만 겹치는 다른 ID는 나오지 않음
+    assert index.search("62559") == []
+
+
+def test_search_symbol_only_returns_nothing(index):
+    assert index.search("-") == []
+
+
+def test_search_ranking_order():
+    # 정확 일치 > 접두어 > 부분 문자열, 같은 점수면 최근 시즌 -> 출장 경기 수 순
+    index = PlayerSearchIndex([
+        make_entry("박민", season=2024),
+        make_entry("박민우", season=2025, games=5),
+        make_entry("박민우", season=2025, games=100),
+        make_entry("오박민", season=2025),
+        make_entry("박민", season=2025),
+    ])
+    assert [(e["name"], e["season"], e["games"]) for e in index.search("박민")] == [
+        ("박민", 2025, 10),
+        ("박민", 2024, 10),
+        ("박민우", 2025, 100),
+        ("박민우", 2025, 5),
+        ("오박민", 2025, 10),
+    ]
+
+
+def test_search_fuzzy_fallback_for_typos(index):
+    # 오타('garabitto')도 bigram 유사도로 찾음
+    assert names(index.search("garabitto"))[0] == ("가라비토", 2025)
+
+
+def test_search_respects_limit(index):
+    assert len(index.search("ㄱ", limit=2)) == 2
+
+
+def test_search_large_index_is_fast():
+    syllables = "가나다라마바사아자차카타파하"
+    entries = [
+        make_entry(syllables[i % 14] + syllables[(i // 14) % 14] + syllables[(i // 196) % 14],
+                   season=2000 + i % 25, games=i % 144, player_id=10000 + i)
+        for i in range(40000)
+    ]
+    index = PlayerSearchIndex(entries)
+    for query in ["가", "ㄱㄴ", "garaba", "10042", "나다마"]:
+        start = time.perf_counter()
+        index.search(query)
+        # 입력할 때마다 호출되므로 색인 조회는 충분히 빨라야 함 (여유 있게 잡은 상한)
+        assert time.perf_counter() - start < 0.5, query
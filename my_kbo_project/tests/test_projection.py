@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from projection import PROJECTION_SPECS, age_factor, project_next_season
+
+KEY_COLS = ["선수명", "팀명"]
+
+
+def hitter_row(name, season, pa, avg, **overrides):
+    row = {"선수명": name, "팀명": "KT", "season": season, "PA": pa, "AVG": avg,
+           "OBP": 0.350, "SLG": 0.400, "ISOP": 0.100, "GPA": 0.250, "RISP": 0.280,
+           "BB": pa * 0.1, "SO": pa * 0.2, "HR": pa * 0.02, "RBI": pa * 0.1}
+    row.update(overrides)
+    return row
+
+
+def pitcher_row(name, season, ip, era, g=30, gs=0):
+    return {"선수명": name, "팀명": "LG", "season": season, "IP_float": ip, "ERA": era,
+            "WHIP": 1.30, "K/9": 8.0, "BB/9": 3.0, "OPS": 0.700, "BABIP": 0.300, "G": g, "GS": gs}
+
+
+def by_name(proj):
+    return proj.set_index("선수명")
+
+
+# ---------------------------------------------------------
+# 1. 나이 보정
+# ---------------------------------------------------------
+def test_age_factor():
+    np.testing.assert_allclose(age_factor([25, 29, 33, np.nan]), [1.024, 1.0, 0.988, 1.0])
+
+
+# ---------------------------------------------------------
+# 2. 가중 평균 + 평균 회귀
+# ---------------------------------------------------------
+def test_hitter_weighted_regression():
+    history = pd.DataFrame([
+        hitter_row("A", 2025, 100, 0.300),
+        hitter_row("A", 2024, 200, 0.250),
+        hitter_row("B", 2025, 300, 0.200),
+    ])
+    proj = by_name(project_next_season(history, "hitter", KEY_COLS))
+
+    # 2025 리그 AVG = (100*.300 + 300*.200) / 400, 2024 리그 AVG = .250 (A만 출장)
+    league_2025 = (100 * 0.300 + 300 * 0.200) / 400
+    weighted_pa = 1.0 * 100 + 0.8 * 200
+    player_sum = 1.0 * 100 * 0.300 + 0.8 * 200 * 0.250
+    league_sum = 1.0 * 100 * league_2025 + 0.8 * 200 * 0.250
+    regression = PROJECTION_SPECS["hitter"]["regression"]
+    expected = (player_sum + regression * league_sum / weighted_pa) / (weighted_pa + regression)
+
+    assert proj.loc["A", "AVG"] == pytest.approx(expected)
+    assert proj.loc["B", "AVG"] == pytest.approx((300 * 0.200 + regression * league_2025) / (300 + regression))
+    assert (proj["season"] == 2026).all()
+
+
+def test_hitter_playing_time_and_counting_stats():
+    history = pd.DataFrame([
+        hitter_row("A", 2025, 400, 0.280),
+        hitter_row("A", 2024, 500, 0.280),
+    ])
+    proj = by_name(project_next_season(history, "hitter", KEY_COLS))
+
+    # 0.5 * 작년 + 0.1 * 재작년 + 200
+    expected_pa = 0.5 * 400 + 0.1 * 500 + 200
+    assert proj.loc["A", "proj_volume"] == pytest.approx(expected_pa)
+    assert proj.loc["A", "PA"] == pytest.approx(expected_pa)
+    # 비율이 모든 시즌에서 같으면 회귀 후에도 그대로 -> 카운팅 스탯 = 비율 * 예측 PA
+    assert proj.loc["A", "HR"] == pytest.approx(0.02 * expected_pa)
+    assert proj.loc["A", "OPS"] == pytest.approx(0.350 + 0.400)
+    assert proj.loc["A", "BB/K"] == pytest.approx(0.5)
+
+
+def test_pitcher_starter_base_volume_and_old_seasons():
+    history = pd.DataFrame([
+        pitcher_row("SP", 2025, 100, 3.00, g=25, gs=20),
+        pitcher_row("RP", 2025, 50, 4.00, g=50, gs=0),
+        pitcher_row("RP", 2024, 60, 4.00, g=55, gs=0),
+        # 3시즌 이전 기록은 가중치가 없으므로 제외
+        pitcher_row("RP", 2022, 80, 9.00, g=40, gs=0),
+    ])
+    proj = by_name(project_next_season(history, "pitcher", KEY_COLS))
+
+    assert proj.loc["SP", "proj_volume"] == pytest.approx(0.5 * 100 + 60)
+    assert proj.loc["RP", "proj_volume"] == pytest.approx(0.5 * 50 + 0.1 * 60 + 25)
+
+    regression = PROJECTION_SPECS["pitcher"]["regression"]
+    league_2025 = (100 * 3.00 + 50 * 4.00) / 150
+    weighted_ip = 1.0 * 50 + 2 / 3 * 60
+    league_sum = 1.0 * 50 * league_2025 + 2 / 3 * 60 * 4.00
+    expected = (weighted_ip * 4.00 + regression * league_sum / weighted_ip) / (weighted_ip + regression)
+    assert proj.loc["RP", "ERA"] == pytest.approx(expected)
+    assert proj.loc["SP", "SO"] == pytest.approx(proj.loc["SP", "K/9"] * (0.5 * 100 + 60) / 9)
+
+
+def test_age_adjustment_direction():
+    rows = [hitter_row("A", 2025, 300, 0.270), hitter_row("B", 2025, 300, 0.250)]
+    base = by_name(project_next_season(pd.DataFrame(rows), "hitter", KEY_COLS))
+    aged = by_name(project_next_season(pd.DataFrame(rows).assign(나이=[24, 34]), "hitter", KEY_COLS))
+
+    # 다음 시즌 나이 기준: 25세는 +2.4%, 35세는 -1.8%. 낮을수록 좋은 스탯은 반대로
+    assert aged.loc["A", "AVG"] == pytest.approx(base.loc["A", "AVG"] * 1.024)
+    assert aged.loc["B", "AVG"] == pytest.approx(base.loc["B", "AVG"] * 0.982)
+    assert aged.loc["A", "SO_rate"] == pytest.approx(base.loc["A", "SO_rate"] / 1.024)
+
+
+def test_zero_volume_rows_are_ignored():
+    history = pd.DataFrame([
+        hitter_row("A", 2025, 300, 0.270),
+        hitter_row("Z", 2025, 0, 0.0),
+    ])
+    proj = project_next_season(history, "hitter", KEY_COLS)
+    assert list(proj["선수명"]) == ["A"]
+
+    empty = project_next_season(history[history["PA"] == 0], "hitter", KEY_COLS)
+    assert empty.empty
+    assert {"AVG", "proj_volume", "season"} <= set(empty.columns)